@@ -9,10 +9,159 @@ import numpy as np
 import xarray as xr
 import plotly.graph_objects as go
 from plotly.subplots import make_subplots
+import os
+import importlib.util
 from pathlib import Path
+from functools import lru_cache
+from concurrent.futures import ProcessPoolExecutor
 
 
-def create_enhanced_3d_diagram(nc_file, node_file, element_file, result_type='BMD', segments=50):
+# Surface lighting shared by every Mesh3d
+LIGHT_KW = dict(
+    lighting=dict(
+        ambient=0.7,
+        diffuse=0.8,
+        specular=0.3,
+        roughness=0.5,
+        fresnel=0.2
+    ),
+    lightposition=dict(x=1000, y=1000, z=1000),
+    flatshading=False
+)
+
+# HTML export options: plotly.js is loaded from the CDN instead of being
+# embedded (~3 MB) in every file, and the already-built figure is not
+# re-validated on write
+HTML_KW = dict(
+    include_plotlyjs='cdn',
+    full_html=True,
+    validate=False,
+    config={'responsive': True}
+)
+
+# Element count above which surface vertices are built by the (optional)
+# Numba kernel. Below it the NumPy broadcast is faster than importing
+# numba and JIT-loading the kernel in each process.
+NUMBA_MIN_ELEMENTS = 5000
+
+# Element count above which BMD and SFD are built in parallel worker
+# processes. Below it each diagram takes well under the ~0.35 s a worker
+# spends re-importing numpy/xarray/plotly, so both are built in-process.
+PARALLEL_MIN_ELEMENTS = 2000
+
+
+@lru_cache(maxsize=None)
+def _build_tri_indices(segments):
+    """
+    Triangle index arrays (I, J, K) for a strip of `segments` quads whose
+    vertices are stored as interleaved (base, peak) pairs.
+    
+    The arrays depend only on `segments`, so they are shared by every
+    element and marked read-only.
+    """
+    b = 2 * np.arange(segments)
+    I = np.empty(2 * segments, dtype=int)
+    J = np.empty(2 * segments, dtype=int)
+    K = np.empty(2 * segments, dtype=int)
+    I[0::2], I[1::2] = b, b + 1
+    J[0::2], J[1::2] = b + 1, b + 3
+    K[:] = np.repeat(b + 2, 2)
+    for arr in (I, J, K):
+        arr.flags.writeable = False
+    return I, J, K
+
+
+def _build_vertices_numpy(Pi, Pj, Vi, Vj, scale, segments):
+    """
+    Surface vertices for every element at once.
+    
+    Rows are elements, columns are interleaved (base, peak) vertex pairs
+    at the `segments + 1` stations along each element. Returns X, Y, Z
+    and the colour intensity C, each of shape (Nelem, 2 * (segments + 1)).
+    """
+    t = np.linspace(0.0, 1.0, segments + 1)[None, :]
+    
+    x = Pi[:, 0:1] + t * (Pj[:, 0:1] - Pi[:, 0:1])
+    y0 = Pi[:, 1:2] + t * (Pj[:, 1:2] - Pi[:, 1:2])   # Real girder transverse location
+    z = Pi[:, 2:3] + t * (Pj[:, 2:3] - Pi[:, 2:3])
+    
+    v = Vi[:, None] + t * (Vj - Vi)[:, None]
+    
+    # Each station contributes a (base, peak) vertex pair
+    X = np.repeat(x, 2, axis=1)
+    Z = np.repeat(z, 2, axis=1)
+    Y = np.repeat(y0, 2, axis=1)
+    Y[:, 1::2] += v * scale   # Shifted by girder position
+    C = np.repeat(np.abs(v), 2, axis=1)
+    return X, Y, Z, C
+
+
+@lru_cache(maxsize=None)
+def _numba_vertex_kernel():
+    """
+    Numba version of `_build_vertices_numpy` (one element per thread),
+    or None when numba is not installed. numba is imported on first use
+    so small models never pay its import cost.
+    """
+    try:
+        import numba as nb
+    except ImportError:   # optional - falls back to NumPy broadcasting
+        return None
+    
+    @nb.njit(parallel=True, fastmath=True, cache=True)
+    def kernel(Pi, Pj, Vi, Vj, scale, segments):
+        n_elem = Pi.shape[0]
+        n_verts = 2 * (segments + 1)
+        X = np.empty((n_elem, n_verts))
+        Y = np.empty((n_elem, n_verts))
+        Z = np.empty((n_elem, n_verts))
+        C = np.empty((n_elem, n_verts))
+        
+        for e in nb.prange(n_elem):
+            for i in range(segments + 1):
+                t = i / segments
+                
+                x = Pi[e, 0] + t * (Pj[e, 0] - Pi[e, 0])
+                y0 = Pi[e, 1] + t * (Pj[e, 1] - Pi[e, 1])
+                z = Pi[e, 2] + t * (Pj[e, 2] - Pi[e, 2])
+                v = Vi[e] + t * (Vj[e] - Vi[e])
+                
+                b = 2 * i
+                X[e, b] = X[e, b + 1] = x
+                Y[e, b] = y0
+                Y[e, b + 1] = y0 + v * scale
+                Z[e, b] = Z[e, b + 1] = z
+                C[e, b] = C[e, b + 1] = abs(v)
+        
+        return X, Y, Z, C
+    
+    return kernel
+
+
+def _build_vertices(Pi, Pj, Vi, Vj, scale, segments):
+    """
+    Surface vertices for every element at once - NumPy for the usual model
+    sizes, the Numba kernel from NUMBA_MIN_ELEMENTS elements upwards.
+    """
+    if Pi.shape[0] >= NUMBA_MIN_ELEMENTS:
+        kernel = _numba_vertex_kernel()
+        if kernel is not None:
+            return kernel(Pi, Pj, Vi, Vj, scale, segments)
+    return _build_vertices_numpy(Pi, Pj, Vi, Vj, scale, segments)
+
+
+def _polyline(P0, P1):
+    """
+    Flatten line segments P0[k] -> P1[k] ((n, 3) arrays) into x, y, z
+    arrays for a single Scatter3d, with a NaN gap after every segment.
+    """
+    buf = np.full((P0.shape[0], 3, 3), np.nan)
+    buf[:, 0] = P0
+    buf[:, 1] = P1
+    return buf[:, :, 0].ravel(), buf[:, :, 1].ravel(), buf[:, :, 2].ravel()
+
+
+def create_enhanced_3d_diagram(ds, nodes, members, result_type='BMD', segments=50):
     """
     Create enhanced 3D diagram with:
     - CAD-style visible grids
@@ -23,12 +172,12 @@ def create_enhanced_3d_diagram(nc_file, node_file, element_file, result_type='BM
     
     Parameters:
     -----------
-    nc_file : str
-        Path to NetCDF dataset
-    node_file : str
-        Path to node.py file
-    element_file : str
-        Path to element.py file
+    ds : xarray.Dataset
+        Opened NetCDF result dataset
+    nodes : dict
+        node_id -> [x, y, z] (from node.py)
+    members : dict
+        element_id -> [start_node_id, end_node_id] (from element.py)
     result_type : str
         'BMD' or 'SFD'
     segments : int
@@ -39,21 +188,33 @@ def create_enhanced_3d_diagram(nc_file, node_file, element_file, result_type='BM
     print(f"ENHANCED 3D {result_type} GENERATOR - Version 2.1")
     print("="*80 + "\n")
     
-    # Load data
-    print("📂 Loading data files...")
-    ds = xr.open_dataset(nc_file)
-    
-    spec = {}
-    with open(node_file, 'r') as f:
-        exec(f.read(), spec)
-    nodes = spec['nodes']
+    print(f"✓ Using: {len(nodes)} nodes, {len(members)} elements\n")
     
-    spec = {}
-    with open(element_file, 'r') as f:
-        exec(f.read(), spec)
-    members = spec['members']
+    # Node coordinates as an (N, 3) array and element end points as
+    # (Nelem, 3) arrays, so geometry is gathered by position
+    node_ids = np.array(sorted(nodes))
+    coords = np.array([nodes[nid] for nid in node_ids], dtype=float)
+    pos = {nid: k for k, nid in enumerate(node_ids.tolist())}
     
-    print(f"✓ Loaded: {len(nodes)} nodes, {len(members)} elements\n")
+    # members is read once; every later pass iterates these arrays.
+    # Elements without results in the dataset (or with unknown end nodes)
+    # are skipped with a warning, checked once up front
+    element_index = {e: i for i, e in enumerate(ds['Element'].values.tolist())}
+    eid_list = []
+    for eid, (ni, nj) in members.items():
+        if eid not in element_index:
+            print(f" Warning: Could not process element {eid}: not in dataset")
+        elif ni not in pos or nj not in pos:
+            print(f" Warning: Could not process element {eid}: unknown node")
+        else:
+            eid_list.append(eid)
+    
+    eids = np.array(eid_list, dtype=int)
+    pairs = np.array([members[eid] for eid in eid_list], dtype=int)
+    pairs = pairs.reshape(-1, 2)   # (Nelem, 2), also when every element is skipped
+    ni_arr, nj_arr = pairs[:, 0], pairs[:, 1]
+    Pi = coords[[pos[n] for n in ni_arr.tolist()]]
+    Pj = coords[[pos[n] for n in nj_arr.tolist()]]
     
     # ========================================================================
     # DEFINE GIRDERS EXACTLY AS SPECIFIED IN TASK
@@ -86,11 +247,16 @@ def create_enhanced_3d_diagram(nc_file, node_file, element_file, result_type='BM
         }
     }
     
-    # Create reverse mapping: element_id -> girder_name
-    element_to_girder = {}
+    # Girder of each element as a small int into girder_names, aligned
+    # with eids (0 = transverse members, "Other Elements")
+    girder_names = ['Other Elements'] + list(girders)
+    name_to_idx = {gname: g for g, gname in enumerate(girder_names)}
+    eid_to_pos = {eid: k for k, eid in enumerate(eid_list)}
+    girder_idx = np.zeros(len(eids), dtype=np.int8)
     for girder_name, girder_info in girders.items():
         for eid in girder_info['elements']:
-            element_to_girder[eid] = girder_name
+            if eid in eid_to_pos:
+                girder_idx[eid_to_pos[eid]] = name_to_idx[girder_name]
     
     print(" Girder Definitions:")
     for gname, ginfo in girders.items():
@@ -111,16 +277,19 @@ def create_enhanced_3d_diagram(nc_file, node_file, element_file, result_type='BM
     
     # Calculate scale
     print("Calculating scale factor...")
-    all_values = []
-    for eid in members.keys():
-        try:
-            val_i = abs(float(ds['forces'].sel(Element=eid, Component=comp_i).values))
-            val_j = abs(float(ds['forces'].sel(Element=eid, Component=comp_j).values))
-            all_values.extend([val_i, val_j])
-        except:
-            continue
-    
-    max_val = max(all_values) if all_values else 1.0
+    # Plain ndarray indexing on the in-memory forces instead of .sel
+    F = ds['forces'].transpose('Element', 'Component').values
+    component_index = {c: i for i, c in enumerate(ds['Component'].values.tolist())}
+    vals = F[np.ix_(
+        [element_index[eid] for eid in eid_list],
+        [component_index[comp_i], component_index[comp_j]]
+    )]
+    
+    all_abs = np.abs(vals)
+    max_val = float(all_abs.max()) if all_abs.size else 1.0
+    
+    # Shared colour range - intensities are |value|, so they start at 0
+    cmin, cmax = 0.0, max_val
     scale = 1.8 / max_val if max_val > 0 else 1.0
     
     # Increase scale for SFD to make it more visible
@@ -152,18 +321,21 @@ def create_enhanced_3d_diagram(nc_file, node_file, element_file, result_type='BM
     # 1. DRAW ALL STRUCTURE CENTERLINES
     # ========================================================================
     print("Drawing structure centerlines...")
-    for eid, (ni, nj) in members.items():
-        x1, y1, z1 = nodes[ni]
-        x2, y2, z2 = nodes[nj]
+    
+    # One polyline per girder; NaN breaks the line between elements
+    for girder_name in girder_traces:
+        rows = np.flatnonzero(girder_idx == name_to_idx[girder_name])
+        if not rows.size:
+            continue
         
-        # Determine which girder this element belongs to
-        girder_name = element_to_girder.get(eid, 'Other Elements')
+        cx, cy, cz = _polyline(Pi[rows], Pj[rows])
         
         trace = go.Scatter3d(
-            x=[x1, x2],
-            y=[y1, y2],
-            z=[z1, z2],
+            x=cx,
+            y=cy,
+            z=cz,
             mode='lines',
+            connectgaps=False,
             line=dict(
                 color='rgba(20, 20, 20, 1.0)',
                 width=6
@@ -177,162 +349,116 @@ def create_enhanced_3d_diagram(nc_file, node_file, element_file, result_type='BM
         fig.add_trace(trace)
         girder_traces[girder_name].append(len(fig.data) - 1)
     
-    print(f" ✓ Drew {len(members)} centerlines\n")
+    print(f" ✓ Drew {len(eids)} centerlines\n")
     
     # ========================================================================
     # 2. CREATE FORCE/MOMENT SURFACES WITH BORDERS
     # ========================================================================
     print(f" Creating {result_type} surfaces with boundary edges...")
-    element_count = 0
     
-    # Track which girders we've shown in legend (to avoid duplicates)
-    shown_in_legend = set()
+    # Triangle indices are identical for every element
+    I_tmpl, J_tmpl, K_tmpl = _build_tri_indices(segments)
+    n_verts = 2 * (segments + 1)
     
-    for eid, (ni, nj) in members.items():
-        # Determine girder
-        girder_name = element_to_girder.get(eid, 'Other Elements')
+    # Vertices for all elements at once; rows follow eids order
+    X, Y, Z, C = _build_vertices(
+        Pi, Pj,
+        np.ascontiguousarray(vals[:, 0]), np.ascontiguousarray(vals[:, 1]),
+        scale, segments
+    )
+    
+    # Hover labels per element - kept short because each one is repeated
+    # at every vertex; the girder name comes from the trace (hovertemplate)
+    labels = np.array([
+        f"Elem {eid}: {comp_i} {v_i:.2f} / {comp_j} {v_j:.2f} {unit}"
+        for eid, (v_i, v_j) in zip(eid_list, vals.tolist())
+    ], dtype=object)
+    
+    # Peak points at the element ends
+    Ti = Pi.copy()
+    Ti[:, 1] += vals[:, 0] * scale
+    Tj = Pj.copy()
+    Tj[:, 1] += vals[:, 1] * scale
+    
+    # ADD SEMI-TRANSPARENT mesh with enhanced lighting - one per girder
+    surface_count = 0
+    for girder_name in girder_traces:
+        rows = np.flatnonzero(girder_idx == name_to_idx[girder_name])
+        if not rows.size:
+            continue
         
-        try:
-            x1, y1, z1 = nodes[ni]
-            x2, y2, z2 = nodes[nj]
-            
-            v_i = float(ds['forces'].sel(Element=eid, Component=comp_i).values)
-            v_j = float(ds['forces'].sel(Element=eid, Component=comp_j).values)
-            
-            # Create mesh surface
-            X, Y, Z, C = [], [], [], []
-            
-            for i in range(segments + 1):
-                t = i / segments
-                
-                x = x1 + t * (x2 - x1)
-                y0 = y1 + t * (y2 - y1)   # Real girder transverse location
-                z = z1 + t * (z2 - z1)
-                
-                v = v_i + t * (v_j - v_i)
-                
-                X.extend([x, x])
-                Y.extend([y0, y0 + v * scale])   # Shifted by girder position
-                Z.extend([z, z])
-                C.extend([abs(v), abs(v)])
-            
-            # Create triangular mesh
-            I, J, K = [], [], []
-            for i in range(segments):
-                b = i * 2
-                I.extend([b, b + 1])
-                J.extend([b + 1, b + 3])
-                K.extend([b + 2, b + 2])
-            
-            # Show in legend only once per girder
-            show_in_legend = girder_name not in shown_in_legend
-            if show_in_legend:
-                shown_in_legend.add(girder_name)
-            
-            # Add SEMI-TRANSPARENT mesh with enhanced lighting
-            mesh = go.Mesh3d(
-                x=X, y=Y, z=Z,
-                i=I, j=J, k=K,
-                
-                name=girder_name,
-                legendgroup=girder_name,
-                showlegend=show_in_legend,
-                
-                intensity=C,
-                colorscale=colorscale,
-                cmin=min(all_values),
-                cmax=max(all_values),
-                opacity=0.75,
-                showscale=(element_count == 0),
-                colorbar=dict(
-                    title=f"{result_type}<br>({unit})",
-                    thickness=20,
-                    len=0.7,
-                    x=1.02
-                ) if element_count == 0 else None,
-                hovertemplate=(
-                    f"<b>{girder_name} - Element {eid}</b><br>" +
-                    f"Nodes: {ni} → {nj}<br>" +
-                    f"{comp_i}: {v_i:.3f} {unit}<br>" +
-                    f"{comp_j}: {v_j:.3f} {unit}<br>" +
-                    "<extra></extra>"
-                ),
-                flatshading=False,
-                lighting=dict(
-                    ambient=0.7,
-                    diffuse=0.8,
-                    specular=0.3,
-                    roughness=0.5,
-                    fresnel=0.2
-                ),
-                lightposition=dict(x=1000, y=1000, z=1000)
-            )
-            
-            fig.add_trace(mesh)
-            girder_traces[girder_name].append(len(fig.data) - 1)
-            
-            # ADD BOUNDARY EDGES at element ends
-            # Start edge (vertical)
-            edge = go.Scatter3d(
-                x=[x1, x1],
-                y=[y1, y1 + v_i * scale],
-                z=[z1, z1],
-                mode='lines',
-                line=dict(
-                    color='rgba(0, 0, 0, 0.9)',
-                    width=4
-                ),
-                showlegend=False,
-                hoverinfo='skip',
-                name=girder_name,
-                legendgroup=girder_name
-            )
-            fig.add_trace(edge)
-            girder_traces[girder_name].append(len(fig.data) - 1)
-            
-            # End edge (vertical)
-            edge = go.Scatter3d(
-                x=[x2, x2],
-                y=[y2, y2 + v_j * scale],
-                z=[z2, z2],
-                mode='lines',
-                line=dict(
-                    color='rgba(0, 0, 0, 0.9)',
-                    width=2
-                ),
-                showlegend=False,
-                hoverinfo='skip',
-                name=girder_name,
-                legendgroup=girder_name
-            )
-            fig.add_trace(edge)
-            girder_traces[girder_name].append(len(fig.data) - 1)
-            
-            # Top edge (horizontal connecting peaks)
-            edge = go.Scatter3d(
-                x=[x1, x2],
-                y=[y1 + v_i * scale, y2 + v_j * scale],
-                z=[z1, z2],
-                mode='lines',
-                line=dict(
-                    color='rgba(0, 0, 0, 0.9)',
-                    width=1.5
-                ),
-                showlegend=False,
-                hoverinfo='skip',
-                name=girder_name,
-                legendgroup=girder_name
+        # Offset the shared triangle indices to each element's vertex block
+        offsets = (n_verts * np.arange(rows.size))[:, None]
+        
+        # Only the first surface carries the shared colorbar
+        first_surface = (surface_count == 0)
+        surface_count += 1
+        colorbar_kw = dict(
+            colorbar=dict(
+                title=f"{result_type}<br>({unit})",
+                thickness=20,
+                len=0.7,
+                x=1.02
             )
-            fig.add_trace(edge)
-            girder_traces[girder_name].append(len(fig.data) - 1)
+        ) if first_surface else {}
+        
+        surface = go.Mesh3d(
+            x=X[rows].ravel(), y=Y[rows].ravel(), z=Z[rows].ravel(),
+            i=(I_tmpl + offsets).ravel(),
+            j=(J_tmpl + offsets).ravel(),
+            k=(K_tmpl + offsets).ravel(),
             
-            element_count += 1
+            name=girder_name,
+            legendgroup=girder_name,
+            showlegend=True,
             
-        except Exception as e:
-            print(f" Warning: Could not process element {eid}: {e}")
+            intensity=C[rows].ravel(),
+            colorscale=colorscale,
+            cmin=cmin,
+            cmax=cmax,
+            opacity=0.75,
+            showscale=first_surface,
+            text=np.repeat(labels[rows], n_verts),
+            hovertemplate="<b>%{fullData.name}</b> - %{text}<extra></extra>",
+            **colorbar_kw,
+            **LIGHT_KW
+        )
+        
+        fig.add_trace(surface)
+        girder_traces[girder_name].append(len(fig.data) - 1)
+    
+    # ADD BOUNDARY EDGES - one trace per girder
+    for girder_name in girder_traces:
+        rows = np.flatnonzero(girder_idx == name_to_idx[girder_name])
+        if not rows.size:
             continue
+        
+        # BOUNDARY EDGES: start (vertical), end (vertical) and top
+        # (connecting peaks) for every element of the girder
+        ex, ey, ez = _polyline(
+            np.stack([Pi[rows], Pj[rows], Ti[rows]], axis=1).reshape(-1, 3),
+            np.stack([Ti[rows], Tj[rows], Tj[rows]], axis=1).reshape(-1, 3)
+        )
+        
+        edge = go.Scatter3d(
+            x=ex,
+            y=ey,
+            z=ez,
+            mode='lines',
+            connectgaps=False,
+            line=dict(
+                color='rgba(0, 0, 0, 0.9)',
+                width=2
+            ),
+            showlegend=False,
+            hoverinfo='skip',
+            name=girder_name,
+            legendgroup=girder_name
+        )
+        fig.add_trace(edge)
+        girder_traces[girder_name].append(len(fig.data) - 1)
     
-    print(f"  ✓ Created {element_count} surfaces with boundary edges\n")
+    print(f"  ✓ Created surfaces for {len(eids)} elements as {surface_count} Mesh3d traces (one per girder) with boundary edges\n")
     
     # ========================================================================
     # 3. ENHANCED LAYOUT with CAD-STYLE GRIDS
@@ -472,6 +598,40 @@ def create_enhanced_3d_diagram(nc_file, node_file, element_file, result_type='BM
     return fig
 
 
+def _load_module(path):
+    """Import a Python file (node.py / element.py) from its path"""
+    spec = importlib.util.spec_from_file_location(Path(path).stem, path)
+    module = importlib.util.module_from_spec(spec)
+    spec.loader.exec_module(module)
+    return module
+
+
+def load_inputs(nc_file, node_file, element_file):
+    """Load nodes, members and the result dataset (forces read into memory)"""
+    print("📂 Loading data files...")
+    nodes = _load_module(node_file).nodes
+    members = _load_module(element_file).members
+    ds = xr.open_dataset(nc_file)
+    ds['forces'].load()   # one bulk read instead of one per lookup
+    return ds, nodes, members
+
+
+def save_diagram(ds, nodes, members, result_type, output_file, segments=50):
+    """Create one diagram and save it as HTML"""
+    fig = create_enhanced_3d_diagram(ds, nodes, members, result_type, segments=segments)
+    fig.write_html(output_file, **HTML_KW)
+    print(f"Saved: {output_file}")
+    return fig
+
+
+def build_and_save(result_type, output_file, nc_file, node_file, element_file,
+                   segments=50):
+    """Worker entry point: load the inputs, create and save one diagram"""
+    ds, nodes, members = load_inputs(nc_file, node_file, element_file)
+    print(f"✓ Loaded: {len(nodes)} nodes, {len(members)} elements\n")
+    return save_diagram(ds, nodes, members, result_type, output_file, segments=segments)
+
+
 def main():
     """Main execution"""
     print("\n" + "="*80)
@@ -491,31 +651,34 @@ def main():
     
     print("✓ All input files found\n")
     
-    # Create BMD
     print("="*80)
-    print("GENERATING BENDING MOMENT DIAGRAM (BMD)")
+    print("GENERATING BENDING MOMENT (BMD) AND SHEAR FORCE (SFD) DIAGRAMS")
     print("="*80)
-    bmd_fig = create_enhanced_3d_diagram(nc_file, node_file, element_file, 'BMD', segments=50)
+    result_types = ['BMD', 'SFD']
+    output_files = ['Enhanced_BMD_3D.html', 'Enhanced_SFD_3D.html']
     
-    # Save and show
-    output_bmd = 'Enhanced_BMD_3D.html'
-    bmd_fig.write_html(output_bmd)
-    print(f"Saved: {output_bmd}")
-    bmd_fig.show()
+    # Load once; the pool is only worth its start-up cost on large models
+    ds, nodes, members = load_inputs(nc_file, node_file, element_file)
+    print(f"✓ Loaded: {len(nodes)} nodes, {len(members)} elements\n")
     
-    # Create SFD
-    print("\n" + "="*80)
-    print("GENERATING SHEAR FORCE DIAGRAM (SFD)")
-    print("="*80)
-    sfd_fig = create_enhanced_3d_diagram(nc_file, node_file, element_file, 'SFD', segments=50)
+    n_workers = min(len(result_types), os.cpu_count() or 1)
+    if n_workers > 1 and len(members) >= PARALLEL_MIN_ELEMENTS:
+        # BMD and SFD are independent - build and save them in worker
+        # processes, each loading its own copy of the input data
+        with ProcessPoolExecutor(max_workers=n_workers) as executor:
+            figs = list(executor.map(build_and_save, result_types, output_files,
+                                     [nc_file] * len(result_types),
+                                     [node_file] * len(result_types),
+                                     [element_file] * len(result_types)))
+    else:
+        # Build both diagrams in this process from the single load
+        figs = [save_diagram(ds, nodes, members, result_type, output_file)
+                for result_type, output_file in zip(result_types, output_files)]
     
-    # Save and show
-    output_sfd = 'Enhanced_SFD_3D.html'
-    sfd_fig.write_html(output_sfd)
-    print(f" Saved: {output_sfd}")
-    sfd_fig.show()
+    # Show from the parent, so no worker blocks on a browser
+    for fig in figs:
+        fig.show()
     
-   
     print("ALL ENHANCED DIAGRAMS COMPLETE")
     
 
@@ -1,3 +1,4 @@
+import matplotlib
 import matplotlib.pyplot as plt
 import xarray as xr
 import numpy as np
@@ -46,46 +47,29 @@ print("Central girder connectivity verified")
 # Extract bending moment and shear force values
 # ------------------------------------------------------------
 
-positions = []
-bending_moments = []
-shear_forces = []
-
 print("\nExtracting Mz and Vy for central girder...")
 
-for idx, ele in enumerate(central_elements):
-
-    node_i = members[ele][0]
-    node_j = members[ele][1]
-
-    coord_i = nodes[node_i]
-    coord_j = nodes[node_j]
-
-    # position along girder (x direction)
-    pos_i = coord_i[0]
-    pos_j = coord_j[0]
-
-    try:
-        mz_i = float(ds['forces'].sel(Element=ele, Component='Mz_i').values)
-        mz_j = float(ds['forces'].sel(Element=ele, Component='Mz_j').values)
-        vy_i = float(ds['forces'].sel(Element=ele, Component='Vy_i').values)
-        vy_j = float(ds['forces'].sel(Element=ele, Component='Vy_j').values)
-    except KeyError as e:
-        print("Error reading element", ele)
-        print("Available components:", ds['Component'].values)
-        raise
-
-    if idx == 0:
-        positions.extend([pos_i, pos_j])
-        bending_moments.extend([mz_i, mz_j])
-        shear_forces.extend([vy_i, vy_j])
-    else:
-        positions.append(pos_j)
-        bending_moments.append(mz_j)
-        shear_forces.append(vy_j)
-
-positions = np.array(positions)
-bending_moments = np.array(bending_moments)
-shear_forces = np.array(shear_forces)
+try:
+    forces = ds['forces'].sel(
+        Element=central_elements,
+        Component=['Mz_i', 'Mz_j', 'Vy_i', 'Vy_j']
+    ).transpose('Element', 'Component').values
+except KeyError as e:
+    print("Error reading central girder elements", central_elements)
+    print("Available components:", ds['Component'].values)
+    raise
+
+mz_i, mz_j, vy_i, vy_j = forces.T
+
+# position along girder (x direction)
+pos_i = np.array([nodes[members[ele][0]][0] for ele in central_elements])
+pos_j = np.array([nodes[members[ele][1]][0] for ele in central_elements])
+
+# The girder is continuous, so only the first element contributes its
+# i-end; every element contributes its j-end
+positions = np.concatenate([[pos_i[0]], pos_j])
+bending_moments = np.concatenate([[mz_i[0]], mz_j])
+shear_forces = np.concatenate([[vy_i[0]], vy_j])
 
 print("Extraction completed")
 print("Number of points:", len(positions))
@@ -94,8 +78,6 @@ print("Number of points:", len(positions))
 # Plot SFD and BMD
 # ------------------------------------------------------------
 
-import mplcursors
-
 fig, axes = plt.subplots(2, 1, figsize=(14, 10), sharex=True)
 
 # -----------------------
@@ -150,24 +132,42 @@ ax_sfd.set_title(
 # Interactive hover values
 # ------------------------------------------------------------
 
-cursor_bmd = mplcursors.cursor(line_bmd, hover=True)
-cursor_sfd = mplcursors.cursor(line_sfd, hover=True)
-
-@cursor_bmd.connect("add")
-def on_add_bmd(sel):
-    x, y = sel.target
-    sel.annotation.set_text(
-        f"Position: {x:.2f} m\nMoment: {y:.2f} kNm"
-    )
-    sel.annotation.get_bbox_patch().set(fc="white", alpha=0.9)
-
-@cursor_sfd.connect("add")
-def on_add_sfd(sel):
-    x, y = sel.target
-    sel.annotation.set_text(
-        f"Position: {x:.2f} m\nShear: {y:.2f} kN"
-    )
-    sel.annotation.get_bbox_patch().set(fc="white", alpha=0.9)
+# Hover annotations only make sense on an interactive backend; skip the
+# event wiring for headless / file-only runs (matplotlib's own list of
+# non-interactive backends, plus the static Jupyter inline backend)
+try:   # matplotlib >= 3.9
+    from matplotlib.backends import backend_registry, BackendFilter
+    non_interactive_bk = backend_registry.list_builtin(BackendFilter.NON_INTERACTIVE)
+except ImportError:
+    non_interactive_bk = matplotlib.rcsetup.non_interactive_bk
+
+backend = matplotlib.get_backend().lower()
+is_interactive = not (
+    backend in {bk.lower() for bk in non_interactive_bk}
+    or backend.endswith('backend_inline')
+)
+
+if is_interactive:
+    import mplcursors
+
+    cursor_bmd = mplcursors.cursor(line_bmd, hover=mplcursors.HoverMode.Transient)
+    cursor_sfd = mplcursors.cursor(line_sfd, hover=mplcursors.HoverMode.Transient)
+
+    @cursor_bmd.connect("add")
+    def on_add_bmd(sel):
+        x, y = sel.target
+        sel.annotation.set_text(
+            f"Position: {x:.2f} m\nMoment: {y:.2f} kNm"
+        )
+        sel.annotation.get_bbox_patch().set(fc="white", alpha=0.9)
+
+    @cursor_sfd.connect("add")
+    def on_add_sfd(sel):
+        x, y = sel.target
+        sel.annotation.set_text(
+            f"Position: {x:.2f} m\nShear: {y:.2f} kN"
+        )
+        sel.annotation.get_bbox_patch().set(fc="white", alpha=0.9)
 
 plt.tight_layout()
 plt.show()